@@ -168,101 +168,209 @@ document.addEventListener('DOMContentLoaded', function() {
   ativarTurno(1);
 });
 
-async function montarGrafico() {
-  console.log('Iniciando montarGrafico...');
-  try {
-    const resposta = await fetch('./data/primeiro_turno/pesquisas_2026_normalizado.json');
-    const pesquisas = await resposta.json();
-    console.log('✓ Pesquisas carregadas:', pesquisas.length);
-    
-    // Carregar médias móveis pré-calculadas
-    const respostaMM = await fetch('./data/primeiro_turno/media_movel_precalculada.json');
-    const mediaMovelData = await respostaMM.json();
-    console.log('✓ Médias móveis carregadas:', Object.keys(mediaMovelData.candidatos));
-  
-  const ctx = document.getElementById('graficoVotos').getContext('2d');
-  const registros = pesquisas.slice().reverse();
 
-  function parseDate(str) {
-    if (!str) return null;
-    let m = str.match(/(\d{1,2})[-](\d{1,2})\s+([A-Za-z]+)\s+(\d{4})/);
-    if (m) return new Date(`${m[3]} ${m[2]}, ${m[4]}`);
-    m = str.match(/(\d{1,2})\s+([A-Za-z]+)\s*[-]\s*(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})/);
-    if (m) return new Date(`${m[4]} ${m[3]}, ${m[5]}`);
-    m = str.match(/(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})/);
-    if (m) return new Date(`${m[2]} ${m[1]}, ${m[3]}`);
-    return null;
+// Worker compartilhado pelos dois turnos: filtra a timeline fora da thread principal
+const timelineWorker = new Worker('timeline-worker.js');
+const timelineHandlers = {};
+
+timelineWorker.addEventListener('message', (e) => {
+  const handler = timelineHandlers[e.data.turno];
+  if (handler) handler(e.data);
+});
+
+// Traduz mês abreviado ou completo em inglês para português completo
+const MESES_TRADUCAO = {
+  jan: 'Janeiro', feb: 'Fevereiro', mar: 'Março', apr: 'Abril',
+  may: 'Maio', jun: 'Junho', jul: 'Julho', aug: 'Agosto',
+  sep: 'Setembro', oct: 'Outubro', nov: 'Novembro', dec: 'Dezembro'
+};
+const MESES_REGEX = /\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b/gi;
+
+function traduzirMeses(texto) {
+  return texto.replace(MESES_REGEX, (_, abrev) => MESES_TRADUCAO[abrev.toLowerCase()]);
+}
+
+function tituloTooltip(context) {
+  if (!context || context.length === 0) return '';
+  const raw = context[0].raw;
+  if (raw && raw.instituto && raw.data) {
+    return `${raw.instituto} - ${traduzirMeses(raw.data)}`;
   }
+  return '';
+}
 
-  const datas = registros.map(r => parseDate(r.data));
-  
-  const registrosFiltrados = registros;
-  const datasFiltradas = datas;
-  const series = {
-    Lula: registrosFiltrados.map(r => r.candidatos?.Lula ?? null),
-    Tarcísio: registrosFiltrados.map(r => r.candidatos?.Freitas ?? null),
-    Ciro: registrosFiltrados.map(r => r.candidatos?.Gomes ?? null),
-    Caiado: registrosFiltrados.map(r => r.candidatos?.Caiado ?? null),
-    Zema: registrosFiltrados.map(r => r.candidatos?.Zema ?? null),
-    Ratinho: registrosFiltrados.map(r => r.candidatos?.Ratinho ?? null)
-  };
+function labelTooltip(context) {
+  let label = context.dataset.label || '';
+  label = label.replace(' (pesquisas)', '');
+  const value = context.parsed.y;
 
-  function movingAverageByDate(values, dates, windowDays = 31) {
-    const out = [];
-    const msWindow = windowDays * 24 * 60 * 60 * 1000;
-    
-    // First pass: calculate moving averages ONLY for this candidate's data
-    for (let i = 0; i < values.length; i++) {
-      const base = dates[i];
-      if (!base || values[i] == null) { 
-        out.push(null); 
-        continue; 
-      }
-      let sum = 0, cnt = 0;
-      for (let j = 0; j < values.length; j++) {
-        if (values[j] == null) continue; // Skip if no data for this candidate
-        const d = dates[j];
-        if (!d) continue;
-        if (Math.abs(d - base) <= msWindow) { 
-          sum += values[j]; 
-          cnt++; 
-        }
+  if (value !== null) {
+    return `${label}: ${value.toFixed(1)}%`;
+  }
+  return label;
+}
+
+function formatDate(date) {
+  const months = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez'];
+  return `${date.getDate()} ${months[date.getMonth()]} ${date.getFullYear()}`;
+}
+
+function criarDatasets(candidatoMap, colors) {
+  const datasets = [];
+  for (const displayName of Object.keys(candidatoMap)) {
+    // Linha da média móvel; dados chegam do worker da timeline
+    datasets.push({
+      label: displayName,
+      data: [],
+      borderColor: colors[displayName] || '#666',
+      backgroundColor: 'transparent',
+      tension: 0.4,
+      fill: false,
+      pointRadius: 0,
+      pointHoverRadius: 5,
+      borderWidth: 2,
+      parsing: { xAxisKey: 'x', yAxisKey: 'y' }
+    });
+
+    // Pontos das pesquisas individuais
+    datasets.push({
+      label: `${displayName} (pesquisas)`,
+      data: [],
+      borderColor: colors[displayName] || '#666',
+      backgroundColor: colors[displayName] || '#666',
+      showLine: false,
+      pointRadius: 4,
+      pointHoverRadius: 6,
+      parsing: { xAxisKey: 'x', yAxisKey: 'y' }
+    });
+  }
+  return datasets;
+}
+
+// Liga os sliders de período ao worker da timeline.
+// Eventos de input são agrupados por frame de animação e apenas a resposta
+// mais recente do worker é aplicada ao gráfico.
+function configurarTimeline(opcoes) {
+  const {
+    turno, url, chart, registros, candidatoMap, snapshot,
+    timelineStart, timelineEnd, timelineLabel, timelineTrack
+  } = opcoes;
+
+  let dataInicial = null;
+  let totalDias = 0;
+  let ultimoPedido = 0;
+  let frameAgendado = false;
+
+  function dataDoDia(dia) {
+    return new Date(dataInicial.getFullYear(), dataInicial.getMonth(), dataInicial.getDate() + Math.floor(dia));
+  }
+
+  function pedirIntervalo() {
+    frameAgendado = false;
+
+    const startPercentage = parseInt(timelineStart.value, 10);
+    const endPercentage = parseInt(timelineEnd.value, 10);
+    const actualStart = Math.min(startPercentage, endPercentage);
+    const actualEnd = Math.max(startPercentage, endPercentage);
+
+    // Update track background
+    timelineTrack.style.background = `linear-gradient(to right, #ddd ${actualStart}%, #1565c0 ${actualStart}%, #1565c0 ${actualEnd}%, #ddd ${actualEnd}%)`;
+
+    const diaInicio = totalDias * actualStart / 100;
+    const diaFim = totalDias * actualEnd / 100;
+    timelineLabel.textContent = `${formatDate(dataDoDia(diaInicio))} a ${formatDate(dataDoDia(diaFim))}`;
+
+    ultimoPedido += 1;
+    timelineWorker.postMessage({ tipo: 'intervalo', turno, id: ultimoPedido, diaInicio, diaFim });
+  }
+
+  function agendarIntervalo(e) {
+    const startPercentage = parseInt(timelineStart.value, 10);
+    const endPercentage = parseInt(timelineEnd.value, 10);
+
+    // Ensure start is not greater than end
+    if (startPercentage > endPercentage) {
+      if (e.target === timelineStart) {
+        timelineEnd.value = startPercentage;
+      } else {
+        timelineStart.value = endPercentage;
       }
-      out.push(cnt ? sum / cnt : null);
     }
-    
-    // Second pass: interpolate nulls linearly
-    for (let i = 0; i < out.length; i++) {
-      if (out[i] === null) {
-        let prevIdx = -1, nextIdx = -1;
-        
-        // Find previous non-null value
-        for (let j = i - 1; j >= 0; j--) {
-          if (out[j] !== null) { prevIdx = j; break; }
-        }
-        
-        // Find next non-null value
-        for (let j = i + 1; j < out.length; j++) {
-          if (out[j] !== null) { nextIdx = j; break; }
-        }
-        
-        // Linear interpolation
-        if (prevIdx !== -1 && nextIdx !== -1) {
-          const ratio = (i - prevIdx) / (nextIdx - prevIdx);
-          out[i] = out[prevIdx] + (out[nextIdx] - out[prevIdx]) * ratio;
-        } else if (prevIdx !== -1) {
-          out[i] = out[prevIdx];
-        } else if (nextIdx !== -1) {
-          out[i] = out[nextIdx];
-        }
+
+    if (!frameAgendado) {
+      frameAgendado = true;
+      requestAnimationFrame(pedirIntervalo);
+    }
+  }
+
+  function aplicarIntervalo({ id, inicio, fim, series }) {
+    // Descarta respostas já superadas por um pedido mais recente
+    if (id !== ultimoPedido) return;
+
+    for (const dataset of chart.data.datasets) {
+      const isSmoothLine = !dataset.label.includes('(pesquisas)');
+      const displayName = dataset.label.replace(' (pesquisas)', '');
+      const serie = series[candidatoMap[displayName]];
+      if (!serie) continue;
+
+      const valores = isSmoothLine ? serie.media : serie.brutos;
+      const pontos = [];
+      for (let i = 0; i < valores.length; i++) {
+        if (Number.isNaN(valores[i])) continue;
+        const registro = registros[inicio + i];
+        pontos.push({
+          x: i,
+          y: valores[i],
+          instituto: isSmoothLine ? 'Média móvel' : registro.instituto,
+          data: registro.data
+        });
       }
+      dataset.data = pontos;
+    }
+
+    // Update X-axis scale to fill the chart width
+    const numFilteredPoints = fim - inicio;
+    chart.options.scales.x.max = numFilteredPoints > 0 ? numFilteredPoints - 1 : 10;
+    chart.update('none');
+
+    // O gráfico interativo já tem dados: troca o snapshot estático pelo canvas
+    if (snapshot && snapshot.isConnected) {
+      snapshot.remove();
     }
-    
-    return out;
   }
 
-  const labels = registrosFiltrados.map((_, i) => i + 1);
-  const datasets = [];
+  timelineHandlers[turno] = (msg) => {
+    if (msg.tipo === 'carregado') {
+      if (!msg.dataInicial) {
+        console.error(`No valid dates found (${turno})`);
+        return;
+      }
+      dataInicial = new Date(msg.dataInicial);
+      totalDias = msg.totalDias;
+      timelineStart.addEventListener('input', agendarIntervalo);
+      timelineEnd.addEventListener('input', agendarIntervalo);
+      pedirIntervalo();
+    } else if (msg.tipo === 'intervalo') {
+      aplicarIntervalo(msg);
+    } else if (msg.tipo === 'erro') {
+      console.error(`❌ Erro no worker da timeline (${turno}):`, msg.mensagem);
+    }
+  };
+
+  timelineWorker.postMessage({ tipo: 'carregar', turno, url });
+}
+
+async function montarGrafico() {
+  console.log('Iniciando montarGrafico...');
+  try {
+    const resposta = await fetch('./data/primeiro_turno/pesquisas_2026_normalizado.json');
+    const pesquisas = await resposta.json();
+    console.log('✓ Pesquisas carregadas:', pesquisas.length);
+
+  const ctx = document.getElementById('graficoVotos').getContext('2d');
+  const registros = pesquisas.slice().reverse();
+
+  const labels = registros.map((_, i) => i + 1);
   const colors = {
     Lula: '#e53935',
     Tarcísio: '#43a047',
@@ -271,8 +379,8 @@ async function montarGrafico() {
     Zema: '#ff9800',
     Ratinho: '#64b5f6'
   };
-  
-  // Mapa de nomes: chave do series -> chave do JSON pré-calculado
+
+  // Mapa de nomes: nome exibido -> chave do JSON pré-calculado
   const candidatoMap = {
     Lula: 'Lula',
     Tarcísio: 'Freitas',
@@ -282,75 +390,7 @@ async function montarGrafico() {
     Ratinho: 'Ratinho'
   };
 
-  // Mapa de índice para data para cálculo de posição relativa
-  const todasAsDatas = mediaMovelData.datas.map(d => new Date(d).getTime());
-  const minDateMs = Math.min(...todasAsDatas);
-  const maxDateMs = Math.max(...todasAsDatas);
-  const totalMs = maxDateMs - minDateMs;
-
-  for (const displayName of Object.keys(series)) {
-    // Converter nome para a chave correta no JSON pré-calculado
-    const jsonKey = candidatoMap[displayName];
-    const mmData = mediaMovelData.candidatos[jsonKey];
-    if (!mmData) continue;
-    
-    // Smooth line dataset - usa média móvel pré-calculada
-    const lineData = mmData.media_movel.map((avg, i) => {
-      if (avg === null) return null;
-      return {
-        x: i / (registros.length - 1) * (registros.length - 1),
-        y: avg,
-        instituto: 'Média móvel',
-        data: registros[i].data
-      };
-    }).filter(d => d !== null);
-    
-    datasets.push({
-      label: displayName,
-      data: lineData,
-      borderColor: colors[displayName] || '#666',
-      backgroundColor: 'transparent',
-      tension: 0.4,
-      fill: false,
-      pointRadius: 0,
-      pointHoverRadius: 5,
-      borderWidth: 2,
-      parsing: {
-        xAxisKey: 'x',
-        yAxisKey: 'y'
-      }
-    });
-    
-    // Raw points dataset - posicionados pela data real
-    const pointsData = [];
-    for (let i = 0; i < mmData.pesquisas_brutos.length; i++) {
-      const val = mmData.pesquisas_brutos[i];
-      if (val !== null) {
-        // Posição relativa baseada na data
-        const posicaoRelativa = (todasAsDatas[i] - minDateMs) / totalMs * (registros.length - 1);
-        pointsData.push({
-          x: posicaoRelativa,
-          y: val,
-          instituto: registrosFiltrados[i].instituto,
-          data: registrosFiltrados[i].data
-        });
-      }
-    }
-    
-    datasets.push({
-      label: `${displayName} (pesquisas)`,
-      data: pointsData,
-      borderColor: colors[displayName] || '#666',
-      backgroundColor: colors[displayName] || '#666',
-      showLine: false,
-      pointRadius: 4,
-      pointHoverRadius: 6,
-      parsing: {
-        xAxisKey: 'x',
-        yAxisKey: 'y'
-      }
-    });
-  }
+  const datasets = criarDatasets(candidatoMap, colors);
 
   const chart = new Chart(ctx, {
     type: 'line',
@@ -384,52 +424,13 @@ async function montarGrafico() {
           mode: 'nearest',
           intersect: false,
           callbacks: {
-            title: function(context) {
-              if (!context || context.length === 0) return '';
-              const raw = context[0].raw;
-              if (raw && raw.instituto && raw.data) {
-                // Traduz mês abreviado (inglês e português) para português completo
-                const mesesTraducao = {
-                  'Jan': 'Janeiro', 'January': 'Janeiro',
-                  'Feb': 'Fevereiro', 'February': 'Fevereiro',
-                  'Mar': 'Março', 'March': 'Março',
-                  'Apr': 'Abril', 'April': 'Abril',
-                  'May': 'Maio',
-                  'Jun': 'Junho', 'June': 'Junho',
-                  'Jul': 'Julho', 'July': 'Julho',
-                  'Aug': 'Agosto', 'August': 'Agosto',
-                  'Sep': 'Setembro', 'September': 'Setembro', 
-                  'Oct': 'Outubro', 'October': 'Outubro', 
-                  'Nov': 'Novembro', 'November': 'Novembro',
-                  'Dec': 'Dezembro', 'December': 'Dezembro'
-                };
-                
-                let dataFormatada = raw.data;
-                // Substitui mês abreviado ou em inglês por completo em português
-                for (const [abrev, completo] of Object.entries(mesesTraducao)) {
-                  const regex = new RegExp(abrev, 'gi');
-                  dataFormatada = dataFormatada.replace(regex, completo);
-                }
-                
-                return `${raw.instituto} - ${dataFormatada}`;
-              }
-              return '';
-            },
-            label: function(context) {
-              let label = context.dataset.label || '';
-              label = label.replace(' (pesquisas)', '');
-              const value = context.parsed.y;
-              
-              if (value !== null) {
-                return `${label}: ${value.toFixed(1)}%`;
-              }
-              return label;
-            }
+            title: tituloTooltip,
+            label: labelTooltip
           }
         }
       },
       scales: {
-        x: { 
+        x: {
           display: false,
           type: 'linear',
           max: registros.length - 1,
@@ -453,195 +454,62 @@ async function montarGrafico() {
   // Armazenar instância do gráfico para controlar pontos
   window.graficoInstance = chart;
 
-  // Event listener removed - filtering is now done via legend click
+  // Timeline filtering with dual range (via worker)
+  configurarTimeline({
+    turno: 'primeiro',
+    url: './data/primeiro_turno/media_movel_precalculada.json',
+    chart,
+    registros,
+    candidatoMap,
+    snapshot: document.getElementById('snapshot-primeiro'),
+    timelineStart: document.getElementById('timeline-start'),
+    timelineEnd: document.getElementById('timeline-end'),
+    timelineLabel: document.getElementById('timeline-label'),
+    timelineTrack: document.getElementById('timeline-track')
+  });
 
-  // Timeline filtering with dual range
-  const timelineStart = document.getElementById('timeline-start');
-  const timelineEnd = document.getElementById('timeline-end');
-  const timelineLabel = document.getElementById('timeline-label');
-  const timelineTrack = document.getElementById('timeline-track');
-  
-  // Get date range - filter out nulls
-  const validDates = datasFiltradas.filter(d => d !== null && d !== undefined);
-  
-  if (validDates.length === 0) {
-    console.error('No valid dates found');
-    return;
-  }
-  
-  const minDate = new Date(Math.min(...validDates.map(d => d.getTime())));
-  const maxDate = new Date(Math.max(...validDates.map(d => d.getTime())));
-  
-  function formatDate(date) {
-    const months = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez'];
-    return `${date.getDate()} ${months[date.getMonth()]} ${date.getFullYear()}`;
-  }
-  
-  function updateTimeline() {
-    const startPercentage = parseInt(timelineStart.value);
-    const endPercentage = parseInt(timelineEnd.value);
-    
-    // Ensure start is not greater than end
-    if (startPercentage > endPercentage) {
-      if (event.target === timelineStart) {
-        timelineEnd.value = startPercentage;
-      } else {
-        timelineStart.value = endPercentage;
-      }
-    }
-    
-    const actualStart = Math.min(startPercentage, endPercentage);
-    const actualEnd = Math.max(startPercentage, endPercentage);
-    
-    // Update track background
-    timelineTrack.style.background = `linear-gradient(to right, #ddd ${actualStart}%, #1565c0 ${actualStart}%, #1565c0 ${actualEnd}%, #ddd ${actualEnd}%)`;
-    
-    // Calculate dates
-    const timeRange = maxDate - minDate;
-    const startTime = minDate.getTime() + (timeRange * actualStart / 100);
-    const endTime = minDate.getTime() + (timeRange * actualEnd / 100);
-    const startDate = new Date(startTime);
-    const endDate = new Date(endTime);
-    
-    // Filter data points by timeline
-    const filteredDataIndices = datasFiltradas.map((d, i) => d >= startDate && d <= endDate ? i : -1).filter(i => i !== -1);
-    
-    // Update datasets with filtered data
-    for (let datasetIdx = 0; datasetIdx < chart.data.datasets.length; datasetIdx++) {
-      const dataset = chart.data.datasets[datasetIdx];
-      const isSmoothLine = !dataset.label.includes('(pesquisas)');
-      const displayName = isSmoothLine ? dataset.label : dataset.label.replace(' (pesquisas)', '');
-      const jsonKey = candidatoMap[displayName];
-      
-      if (isSmoothLine) {
-        // Smooth line: filtrar dados pré-calculados
-        const mmData = mediaMovelData.candidatos[jsonKey];
-        if (!mmData) continue;
-        
-        const filteredLine = filteredDataIndices
-          .map((origIdx, idx) => {
-            const avg = mmData.media_movel[origIdx];
-            if (avg === null) return null;
-            return {
-              x: idx / (filteredDataIndices.length - 1 || 1) * (filteredDataIndices.length - 1),
-              y: avg,
-              instituto: 'Média móvel',
-              data: registrosFiltrados[origIdx].data
-            };
-          })
-          .filter(d => d !== null);
-        
-        dataset.data = filteredLine;
-      } else {
-        // Raw points: filtrar e reposicionar
-        const mmData = mediaMovelData.candidatos[jsonKey];
-        if (!mmData) continue;
-        
-        const filteredPoints = [];
-        for (let i = 0; i < filteredDataIndices.length; i++) {
-          const origIdx = filteredDataIndices[i];
-          const val = mmData.pesquisas_brutos[origIdx];
-          if (val !== null) {
-            // Posição relativa dentro do período filtrado
-            const posicaoRelativa = (filteredDataIndices.length > 1)
-              ? i / (filteredDataIndices.length - 1) * (filteredDataIndices.length - 1)
-              : 0;
-            filteredPoints.push({
-              x: posicaoRelativa,
-              y: val,
-              instituto: registrosFiltrados[origIdx].instituto,
-              data: registrosFiltrados[origIdx].data
-            });
-          }
-        }
-        
-        dataset.data = filteredPoints;
-      }
-    }
-    
-    // Update timeline label
-    timelineLabel.textContent = `${formatDate(startDate)} a ${formatDate(endDate)}`;
-    
-    // Update X-axis scale to fill the chart width
-    const numFilteredPoints = filteredDataIndices.length;
-    chart.options.scales.x.max = numFilteredPoints > 0 ? numFilteredPoints - 1 : 10;
-    
-    chart.resize();
-    chart.update();
-    
-    // Update média final box
-    updateMediaFinalBox(filteredDataIndices);
-  }
-  
-  function updateMediaFinalBox(filteredIndices) {
-    const mediaFinalItems = document.getElementById('media-final-items');
-    mediaFinalItems.innerHTML = '';
-    
-    const candidatos = ['Lula', 'Tarcísio (Freitas)', 'Ciro (Gomes)', 'Caiado', 'Zema', 'Ratinho'];
-    const cores = ['#e53935', '#43a047', '#8e24aa', '#1565c0', '#ff9800', '#64b5f6'];
-    const nomesAbreviados = ['Lula', 'Tarcísio', 'Ciro', 'Caiado', 'Zema', 'Ratinho'];
-    
-    // Usa sempre o último índice do período geral (não do filtrado)
-    const lastIdx = registros.length - 1;
-    
-    // Coleta dados de todos os candidatos
-    const dados = [];
-    candidatos.forEach((cand, idx) => {
-      const jsonKey = cand.replace('Tarcísio (Freitas)', 'Freitas').replace('Ciro (Gomes)', 'Gomes');
-      const mmData = mediaMovelData.candidatos[jsonKey];
-      
-      if (mmData) {
-        const lastValue = mmData.media_movel[lastIdx];
-        
-        if (lastValue !== null) {
-          dados.push({
-            nome: nomesAbreviados[idx],
-            valor: lastValue,
-            cor: cores[idx]
-          });
-        }
-      }
-    });
-    
-    // Ordena por valor (decrescente)
-    dados.sort((a, b) => b.valor - a.valor);
-    
-    // Insere os itens ordenados
-    dados.forEach((d) => {
-      const item = document.createElement('div');
-      item.className = 'media-item';
-      item.innerHTML = `
-        <span style="color: ${d.cor}; font-size: 1.2rem;">●</span>
-        <span class="media-item-name">${d.nome}</span>
-        <span class="media-item-valor">${d.valor.toFixed(1)}%</span>
-      `;
-      mediaFinalItems.appendChild(item);
-    });
-  }
-  
-  timelineStart.addEventListener('input', updateTimeline);
-  timelineEnd.addEventListener('input', updateTimeline);
-  
-  // Initialize timeline with first render
-  updateTimeline();
-  
   // Force chart resize on window resize
   window.addEventListener('resize', () => {
     chart.resize();
   });
-  
-  // Initialize timeline label and média final box
-  timelineLabel.textContent = `${formatDate(minDate)} a ${formatDate(maxDate)}`;
-  updateMediaFinalBox(registros.map((_, i) => i));
   } catch (error) {
     console.error('❌ Erro ao montar gráfico:', error);
     document.getElementById('graficoVotos').innerHTML = `<p style="color: red; padding: 20px;">Erro: ${error.message}</p>`;
   }
 }
 
+// Carrega o Chart.js sob demanda; até lá a página mostra o snapshot estático
+// e a média atual gerados pelo pipeline (scripts/gerar_snapshot.py)
+function carregarChartJs() {
+  if (window.Chart) return Promise.resolve();
+  return new Promise((resolve, reject) => {
+    const script = document.createElement('script');
+    script.src = 'https://cdn.jsdelivr.net/npm/chart.js';
+    script.onload = resolve;
+    script.onerror = () => reject(new Error('Falha ao carregar Chart.js'));
+    document.head.appendChild(script);
+  });
+}
+
+function quandoOcioso(callback) {
+  if ('requestIdleCallback' in window) {
+    requestIdleCallback(callback, { timeout: 2000 });
+  } else {
+    setTimeout(callback, 200);
+  }
+}
+
 window.addEventListener('load', () => {
-  montarGrafico();
-  montarGraficoSegundoTurno();
+  quandoOcioso(async () => {
+    try {
+      await carregarChartJs();
+    } catch (error) {
+      console.error('❌ Erro ao carregar Chart.js:', error);
+      return;
+    }
+    montarGrafico();
+    montarGraficoSegundoTurno();
+  });
 });
 
 async function montarGraficoSegundoTurno() {
@@ -651,34 +519,10 @@ async function montarGraficoSegundoTurno() {
     const pesquisas = await resposta.json();
     console.log('✓ Pesquisas 2º turno carregadas:', pesquisas.length);
 
-    const respostaMM = await fetch('./data/segundo_turno/media_movel_segundo_turno_precalculada.json');
-    const mediaMovelData = await respostaMM.json();
-    console.log('✓ Médias móveis 2º turno carregadas:', Object.keys(mediaMovelData.candidatos));
-
     const ctx = document.getElementById('graficoVotosSegundo').getContext('2d');
     const registros = pesquisas.slice().reverse();
 
-    function parseDate(str) {
-      if (!str) return null;
-      let m = str.match(/(\d{1,2})[-](\d{1,2})\s+([A-Za-z]+)\s+(\d{4})/);
-      if (m) return new Date(`${m[3]} ${m[2]}, ${m[4]}`);
-      m = str.match(/(\d{1,2})\s+([A-Za-z]+)\s*[-]\s*(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})/);
-      if (m) return new Date(`${m[4]} ${m[3]}, ${m[5]}`);
-      m = str.match(/(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})/);
-      if (m) return new Date(`${m[2]} ${m[1]}, ${m[3]}`);
-      return null;
-    }
-
-    const datas = registros.map(r => parseDate(r.data));
-    const registrosFiltrados = registros;
-    const datasFiltradas = datas;
-    const series = {
-      Lula: registrosFiltrados.map(r => r.candidatos?.Lula ?? null),
-      'Tarcísio': registrosFiltrados.map(r => r.candidatos?.Freitas ?? null)
-    };
-
-    const labels = registrosFiltrados.map((_, i) => i + 1);
-    const datasets = [];
+    const labels = registros.map((_, i) => i + 1);
     const colors = {
       Lula: '#e53935',
       'Tarcísio': '#43a047'
@@ -689,64 +533,7 @@ async function montarGraficoSegundoTurno() {
       'Tarcísio': 'Freitas'
     };
 
-    const todasAsDatas = mediaMovelData.datas.map(d => new Date(d).getTime());
-    const minDateMs = Math.min(...todasAsDatas);
-    const maxDateMs = Math.max(...todasAsDatas);
-    const totalMs = maxDateMs - minDateMs;
-
-    for (const displayName of Object.keys(series)) {
-      const jsonKey = candidatoMap[displayName];
-      const mmData = mediaMovelData.candidatos[jsonKey];
-      if (!mmData) continue;
-
-      const lineData = mmData.media_movel.map((avg, i) => {
-        if (avg === null) return null;
-        return {
-          x: i / (registros.length - 1) * (registros.length - 1),
-          y: avg,
-          instituto: 'Média móvel',
-          data: registros[i].data
-        };
-      }).filter(d => d !== null);
-
-      datasets.push({
-        label: displayName,
-        data: lineData,
-        borderColor: colors[displayName] || '#666',
-        backgroundColor: 'transparent',
-        tension: 0.4,
-        fill: false,
-        pointRadius: 0,
-        pointHoverRadius: 5,
-        borderWidth: 2,
-        parsing: { xAxisKey: 'x', yAxisKey: 'y' }
-      });
-
-      const pointsData = [];
-      for (let i = 0; i < mmData.pesquisas_brutos.length; i++) {
-        const val = mmData.pesquisas_brutos[i];
-        if (val !== null) {
-          const posicaoRelativa = (todasAsDatas[i] - minDateMs) / totalMs * (registros.length - 1);
-          pointsData.push({
-            x: posicaoRelativa,
-            y: val,
-            instituto: registrosFiltrados[i].instituto,
-            data: registrosFiltrados[i].data
-          });
-        }
-      }
-
-      datasets.push({
-        label: `${displayName} (pesquisas)`,
-        data: pointsData,
-        borderColor: colors[displayName] || '#666',
-        backgroundColor: colors[displayName] || '#666',
-        showLine: false,
-        pointRadius: 4,
-        pointHoverRadius: 6,
-        parsing: { xAxisKey: 'x', yAxisKey: 'y' }
-      });
-    }
+    const datasets = criarDatasets(candidatoMap, colors);
 
     const chart = new Chart(ctx, {
       type: 'line',
@@ -779,44 +566,8 @@ async function montarGraficoSegundoTurno() {
             mode: 'nearest',
             intersect: false,
             callbacks: {
-              title: function(context) {
-                if (!context || context.length === 0) return '';
-                const raw = context[0].raw;
-                if (raw && raw.instituto && raw.data) {
-                  const mesesTraducao = {
-                    'Jan': 'Janeiro', 'January': 'Janeiro',
-                    'Feb': 'Fevereiro', 'February': 'Fevereiro',
-                    'Mar': 'Março', 'March': 'Março',
-                    'Apr': 'Abril', 'April': 'Abril',
-                    'May': 'Maio',
-                    'Jun': 'Junho', 'June': 'Junho',
-                    'Jul': 'Julho', 'July': 'Julho',
-                    'Aug': 'Agosto', 'August': 'Agosto',
-                    'Sep': 'Setembro', 'September': 'Setembro',
-                    'Oct': 'Outubro', 'October': 'Outubro',
-                    'Nov': 'Novembro', 'November': 'Novembro',
-                    'Dec': 'Dezembro', 'December': 'Dezembro'
-                  };
-
-                  let dataFormatada = raw.data;
-                  for (const [abrev, completo] of Object.entries(mesesTraducao)) {
-                    const regex = new RegExp(abrev, 'gi');
-                    dataFormatada = dataFormatada.replace(regex, completo);
-                  }
-
-                  return `${raw.instituto} - ${dataFormatada}`;
-                }
-                return '';
-              },
-              label: function(context) {
-                let label = context.dataset.label || '';
-                label = label.replace(' (pesquisas)', '');
-                const value = context.parsed.y;
-                if (value !== null) {
-                  return `${label}: ${value.toFixed(1)}%`;
-                }
-                return label;
-              }
+              title: tituloTooltip,
+              label: labelTooltip
             }
           }
         },
@@ -841,157 +592,22 @@ async function montarGraficoSegundoTurno() {
     // Armazenar instância do gráfico para controlar pontos
     window.graficoSegundoInstance = chart;
 
-    const timelineStart = document.getElementById('timeline-start-segundo');
-    const timelineEnd = document.getElementById('timeline-end-segundo');
-    const timelineLabel = document.getElementById('timeline-label-segundo');
-    const timelineTrack = document.getElementById('timeline-track-segundo');
-
-
-    // Only use the actual available date range from the second round data
-    const validDates = datasFiltradas.filter(d => d !== null && d !== undefined);
-    if (validDates.length === 0) {
-      console.error('No valid dates found (2º turno)');
-      return;
-    }
-    // Get the earliest and latest dates from the actual data
-    const minDate = new Date(Math.min(...validDates.map(d => d.getTime())));
-    const maxDate = new Date(Math.max(...validDates.map(d => d.getTime())));
-
-    function formatDate(date) {
-      const months = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez'];
-      return `${date.getDate()} ${months[date.getMonth()]} ${date.getFullYear()}`;
-    }
-
-    function updateTimelineSegundo() {
-      const startPercentage = parseInt(timelineStart.value, 10);
-      const endPercentage = parseInt(timelineEnd.value, 10);
-
-      if (startPercentage > endPercentage) {
-        if (event.target === timelineStart) {
-          timelineEnd.value = startPercentage;
-        } else {
-          timelineStart.value = endPercentage;
-        }
-      }
-
-      const actualStart = Math.min(startPercentage, endPercentage);
-      const actualEnd = Math.max(startPercentage, endPercentage);
-
-      timelineTrack.style.background = `linear-gradient(to right, #ddd ${actualStart}%, #1565c0 ${actualStart}%, #1565c0 ${actualEnd}%, #ddd ${actualEnd}%)`;
-
-      // Use only the available date range for filtering
-      const timeRange = maxDate.getTime() - minDate.getTime();
-      const startTime = minDate.getTime() + (timeRange * actualStart / 100);
-      const endTime = minDate.getTime() + (timeRange * actualEnd / 100);
-      const startDate = new Date(startTime);
-      const endDate = new Date(endTime);
-
-      // Filter indices only within the available dates
-      const filteredDataIndices = datasFiltradas.map((d, i) => d && d >= startDate && d <= endDate ? i : -1).filter(i => i !== -1);
-
-      for (let datasetIdx = 0; datasetIdx < chart.data.datasets.length; datasetIdx++) {
-        const dataset = chart.data.datasets[datasetIdx];
-        const isSmoothLine = !dataset.label.includes('(pesquisas)');
-        const displayName = isSmoothLine ? dataset.label : dataset.label.replace(' (pesquisas)', '');
-        const jsonKey = candidatoMap[displayName];
-        const mmData = mediaMovelData.candidatos[jsonKey];
-        if (!mmData) continue;
-        if (isSmoothLine) {
-          const filteredLine = filteredDataIndices
-            .map((origIdx, idx) => {
-              const avg = mmData.media_movel[origIdx];
-              if (avg === null) return null;
-              return {
-                x: idx / (filteredDataIndices.length - 1 || 1) * (filteredDataIndices.length - 1),
-                y: avg,
-                instituto: 'Média móvel',
-                data: registrosFiltrados[origIdx].data
-              };
-            })
-            .filter(d => d !== null);
-          dataset.data = filteredLine;
-        } else {
-          const filteredPoints = [];
-          for (let i = 0; i < filteredDataIndices.length; i++) {
-            const origIdx = filteredDataIndices[i];
-            const val = mmData.pesquisas_brutos[origIdx];
-            if (val !== null) {
-              const posicaoRelativa = (filteredDataIndices.length > 1)
-                ? i / (filteredDataIndices.length - 1) * (filteredDataIndices.length - 1)
-                : 0;
-              filteredPoints.push({
-                x: posicaoRelativa,
-                y: val,
-                instituto: registrosFiltrados[origIdx].instituto,
-                data: registrosFiltrados[origIdx].data
-              });
-            }
-          }
-          dataset.data = filteredPoints;
-        }
-      }
-
-      timelineLabel.textContent = `${formatDate(startDate)} a ${formatDate(endDate)}`;
-
-      const numFilteredPoints = filteredDataIndices.length;
-      chart.options.scales.x.max = numFilteredPoints > 0 ? numFilteredPoints - 1 : 10;
-      chart.resize();
-      chart.update();
-      updateMediaFinalBoxSegundo(filteredDataIndices);
-    }
-
-    function updateMediaFinalBoxSegundo(filteredIndices) {
-      const mediaFinalItems = document.getElementById('media-final-items-segundo');
-      mediaFinalItems.innerHTML = '';
-
-      const candidatos = ['Lula', 'Tarcísio'];
-      const cores = ['#e53935', '#43a047'];
-      const nomesJson = ['Lula', 'Freitas'];
-
-      const lastIdx = registros.length - 1;
-
-      const dados = [];
-      candidatos.forEach((displayName, idx) => {
-        const jsonKey = nomesJson[idx];
-        const mmData = mediaMovelData.candidatos[jsonKey];
-
-        if (mmData) {
-          const lastValue = mmData.media_movel[lastIdx];
-          if (lastValue !== null) {
-            dados.push({
-              nome: displayName,
-              valor: lastValue,
-              cor: cores[idx]
-            });
-          }
-        }
-      });
-
-      dados.sort((a, b) => b.valor - a.valor);
-
-      dados.forEach((d) => {
-        const item = document.createElement('div');
-        item.className = 'media-item';
-        item.innerHTML = `
-          <span style="color: ${d.cor}; font-size: 1.2rem;">●</span>
-          <span class="media-item-name">${d.nome}</span>
-          <span class="media-item-valor">${d.valor.toFixed(1)}%</span>
-        `;
-        mediaFinalItems.appendChild(item);
-      });
-    }
-
-    timelineStart.addEventListener('input', updateTimelineSegundo);
-    timelineEnd.addEventListener('input', updateTimelineSegundo);
-
-    updateTimelineSegundo();
+    configurarTimeline({
+      turno: 'segundo',
+      url: './data/segundo_turno/media_movel_segundo_turno_precalculada.json',
+      chart,
+      registros,
+      candidatoMap,
+      snapshot: document.getElementById('snapshot-segundo'),
+      timelineStart: document.getElementById('timeline-start-segundo'),
+      timelineEnd: document.getElementById('timeline-end-segundo'),
+      timelineLabel: document.getElementById('timeline-label-segundo'),
+      timelineTrack: document.getElementById('timeline-track-segundo')
+    });
 
     window.addEventListener('resize', () => {
       chart.resize();
     });
-
-    timelineLabel.textContent = `${formatDate(minDate)} a ${formatDate(maxDate)}`;
-    updateMediaFinalBoxSegundo(registros.map((_, i) => i));
   } catch (error) {
     console.error('❌ Erro ao montar gráfico 2º turno:', error);
     document.getElementById('graficoVotosSegundo').innerHTML = `<p style="color: red; padding: 20px;">Erro: ${error.message}</p>`;
@@ -0,0 +1,141 @@
+"""
+Gera os artefatos estáticos para a primeira pintura da página
+- Lê as médias móveis pré-calculadas dos dois turnos
+- Salva um SVG leve com as curvas de média móvel de cada turno
+- Insere no index.html os valores da "Média Atual" de cada turno
+"""
+import json
+import re
+from pathlib import Path
+
+INDEX_FILE = Path("index.html")
+
+LARGURA = 1200
+ALTURA = 600
+MARGEM = 40
+
+TURNOS = [
+    {
+        "nome": "primeiro",
+        "entrada": Path("data/primeiro_turno/media_movel_precalculada.json"),
+        "svg": Path("data/primeiro_turno/snapshot.svg"),
+        "eixo_y": (0, 60),
+        # (nome exibido, chave no JSON, cor) - mesmas cores do script.js
+        "candidatos": [
+            ("Lula", "Lula", "#e53935"),
+            ("Tarcísio", "Freitas", "#43a047"),
+            ("Ciro", "Gomes", "#8e24aa"),
+            ("Caiado", "Caiado", "#1565c0"),
+            ("Zema", "Zema", "#ff9800"),
+            ("Ratinho", "Ratinho", "#64b5f6"),
+        ],
+    },
+    {
+        "nome": "segundo",
+        "entrada": Path("data/segundo_turno/media_movel_segundo_turno_precalculada.json"),
+        "svg": Path("data/segundo_turno/snapshot_segundo_turno.svg"),
+        "eixo_y": (30, 55),
+        "candidatos": [
+            ("Lula", "Lula", "#e53935"),
+            ("Tarcísio", "Freitas", "#43a047"),
+        ],
+    },
+]
+
+
+def ultima_media(media_movel):
+    """Último valor não nulo da média móvel"""
+    for valor in reversed(media_movel):
+        if valor is not None:
+            return valor
+    return None
+
+
+def gerar_svg(dados, candidatos, eixo_y):
+    """Monta o SVG com uma polyline por candidato, posicionada por índice como no gráfico"""
+    y_min, y_max = eixo_y
+    total = len(dados["datas"])
+    largura_util = LARGURA - 2 * MARGEM
+    altura_util = ALTURA - 2 * MARGEM
+
+    def ponto(i, valor):
+        x = MARGEM + (i / (total - 1) * largura_util if total > 1 else 0)
+        y = MARGEM + (y_max - valor) / (y_max - y_min) * altura_util
+        return f"{x:.1f},{y:.1f}"
+
+    linhas = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {LARGURA} {ALTURA}">',
+        '<g font-family="sans-serif" font-size="14" fill="#888">',
+    ]
+    for tick in range(y_min, y_max + 1, 10 if y_max - y_min > 30 else 5):
+        y = MARGEM + (y_max - tick) / (y_max - y_min) * altura_util
+        linhas.append(f'<text x="{MARGEM - 8}" y="{y + 5:.1f}" text-anchor="end">{tick}</text>')
+    linhas.append("</g>")
+
+    for _, chave, cor in candidatos:
+        mm_data = dados["candidatos"].get(chave)
+        if not mm_data:
+            continue
+        pontos = " ".join(ponto(i, v) for i, v in enumerate(mm_data["media_movel"]) if v is not None)
+        if pontos:
+            linhas.append(f'<polyline fill="none" stroke="{cor}" stroke-width="2" points="{pontos}"/>')
+
+    linhas.append("</svg>")
+    return "\n".join(linhas) + "\n"
+
+
+def gerar_media_final(dados, candidatos, indentacao):
+    """HTML dos itens da caixa "Média Atual", ordenados por valor (decrescente)"""
+    itens = []
+    for nome, chave, cor in candidatos:
+        mm_data = dados["candidatos"].get(chave)
+        valor = ultima_media(mm_data["media_movel"]) if mm_data else None
+        if valor is not None:
+            itens.append((valor, nome, cor))
+    itens.sort(key=lambda item: item[0], reverse=True)
+
+    html = []
+    for valor, nome, cor in itens:
+        html.append(
+            f'{indentacao}<div class="media-item">'
+            f'<span style="color: {cor}; font-size: 1.2rem;">●</span>'
+            f'<span class="media-item-name">{nome}</span>'
+            f'<span class="media-item-valor">{valor:.1f}%</span>'
+            f'</div>'
+        )
+    return "\n".join(html)
+
+
+def inserir_media_final(html, turno, itens_html):
+    """Substitui o conteúdo entre os marcadores <!-- media-final:turno --> do index.html"""
+    padrao = re.compile(
+        rf"(<!-- media-final:{turno} -->)(.*?)(\n[ \t]*<!-- /media-final:{turno} -->)",
+        re.DOTALL,
+    )
+    if not padrao.search(html):
+        raise ValueError(f"Marcadores de média final do {turno} turno não encontrados em {INDEX_FILE}")
+    conteudo = "\n" + itens_html if itens_html else ""
+    return padrao.sub(lambda m: m.group(1) + conteudo + m.group(3), html, count=1)
+
+
+def main():
+    html = INDEX_FILE.read_text(encoding="utf-8")
+
+    for turno in TURNOS:
+        dados = json.loads(turno["entrada"].read_text(encoding="utf-8"))
+
+        turno["svg"].write_text(gerar_svg(dados, turno["candidatos"], turno["eixo_y"]), encoding="utf-8")
+        print(f"✓ Snapshot salvo em: {turno['svg']}")
+
+        # Mesma indentação do marcador de abertura
+        marcador = re.search(rf"^([ \t]*)<!-- media-final:{turno['nome']} -->", html, re.MULTILINE)
+        indentacao = marcador.group(1) if marcador else ""
+        itens_html = gerar_media_final(dados, turno["candidatos"], indentacao)
+        html = inserir_media_final(html, turno["nome"], itens_html)
+        print(f"✓ Média atual do {turno['nome']} turno inserida em {INDEX_FILE}")
+
+    INDEX_FILE.write_text(html, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
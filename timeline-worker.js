@@ -0,0 +1,92 @@
+// Agregador de Pesquisas Eleitorais 2026 - Worker da timeline
+//
+// Carrega as médias móveis pré-calculadas em colunas tipadas (um Int32Array de
+// dias desde a primeira pesquisa e um Float32Array por série, com NaN no lugar
+// de null) e responde pedidos de intervalo sem ocupar a thread principal.
+
+const MS_POR_DIA = 24 * 60 * 60 * 1000;
+const turnos = {};
+
+function paraFloat32(valores) {
+  const out = new Float32Array(valores.length);
+  for (let i = 0; i < valores.length; i++) {
+    out[i] = valores[i] === null ? NaN : valores[i];
+  }
+  return out;
+}
+
+// Primeiro índice com dias[i] >= alvo (ou > alvo quando incluirIguais)
+function buscarIndice(dias, alvo, incluirIguais) {
+  let lo = 0;
+  let hi = dias.length;
+  while (lo < hi) {
+    const meio = (lo + hi) >>> 1;
+    if (dias[meio] < alvo || (incluirIguais && dias[meio] === alvo)) {
+      lo = meio + 1;
+    } else {
+      hi = meio;
+    }
+  }
+  return lo;
+}
+
+async function carregarTurno(turno, url) {
+  const resposta = await fetch(url);
+  const mediaMovelData = await resposta.json();
+
+  // As datas já vêm ordenadas e em ISO do pipeline Python
+  const datas = mediaMovelData.datas;
+  const base = datas.length ? Date.parse(datas[0]) : 0;
+  const dias = new Int32Array(datas.length);
+  for (let i = 0; i < datas.length; i++) {
+    dias[i] = Math.round((Date.parse(datas[i]) - base) / MS_POR_DIA);
+  }
+
+  const series = {};
+  for (const [nome, mmData] of Object.entries(mediaMovelData.candidatos)) {
+    series[nome] = {
+      media: paraFloat32(mmData.media_movel),
+      brutos: paraFloat32(mmData.pesquisas_brutos)
+    };
+  }
+
+  turnos[turno] = { dias, series };
+
+  self.postMessage({
+    tipo: 'carregado',
+    turno,
+    dataInicial: datas.length ? datas[0] : null,
+    totalDias: dias.length ? dias[dias.length - 1] : 0
+  });
+}
+
+function responderIntervalo(turno, id, diaInicio, diaFim) {
+  const { dias, series } = turnos[turno];
+  const inicio = buscarIndice(dias, diaInicio, false);
+  const fim = Math.max(inicio, buscarIndice(dias, diaFim, true));
+
+  // slice() copia para buffers próprios, que podem ser transferidos sem cópia
+  const transferir = [];
+  const recorte = {};
+  for (const [nome, serie] of Object.entries(series)) {
+    const media = serie.media.slice(inicio, fim);
+    const brutos = serie.brutos.slice(inicio, fim);
+    recorte[nome] = { media, brutos };
+    transferir.push(media.buffer, brutos.buffer);
+  }
+
+  self.postMessage({ tipo: 'intervalo', turno, id, inicio, fim, series: recorte }, transferir);
+}
+
+self.addEventListener('message', async (e) => {
+  const msg = e.data;
+  try {
+    if (msg.tipo === 'carregar') {
+      await carregarTurno(msg.turno, msg.url);
+    } else if (msg.tipo === 'intervalo' && turnos[msg.turno]) {
+      responderIntervalo(msg.turno, msg.id, msg.diaInicio, msg.diaFim);
+    }
+  } catch (error) {
+    self.postMessage({ tipo: 'erro', turno: msg.turno, mensagem: error.message });
+  }
+});